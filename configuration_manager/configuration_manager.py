@@ -1,15 +1,71 @@
 
 
 import os
+import re
+import copy
+import json
 import yaml
-import glob
+import atexit
 import shutil
 
+# use the libyaml C bindings when available (much faster parse/dump)
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 from datetime import datetime
-import pandas as pd
+from functools import lru_cache
+
+# parquet (pyarrow) loads the experiment record faster and smaller than
+# pickle; fall back to pickle when pyarrow is not installed
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# msgspec ships a hand-written C YAML parser that is a further 2-4x
+# faster than the libyaml bindings
+try:
+    import msgspec.yaml as msgspec_yaml
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
 
 from .logger import InfoLogger
 
+# suffixes an experiment record file can carry
+RECORD_SUFFIXES = ('_experiment_record.parquet', '_experiment_record.pkl')
+
+# (module)_(experiment name)_v(version).yaml
+YAML_NAME_RE = re.compile(r'^(?P<module>[^_]+)_(?P<experiment>.+)_v(?P<version>\d+(?:\.\d+)?)\.yaml$')
+
+@lru_cache(maxsize=256)
+def _parse_yaml_cached(yaml_path, mtime_ns, size, backend='pyyaml'):
+    """parse a YAML file cached on (path, mtime, size)
+
+    The stat signature in the key invalidates the entry whenever the
+    file changes on disk
+    """
+    if backend == 'msgspec':
+        with open(yaml_path, 'rb') as f:
+            return msgspec_yaml.decode(f.read())
+
+    with open(yaml_path, 'r') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+# pandas costs hundreds of ms to import - defer it until the experiment
+# record is actually touched
+pd = None
+
+def _import_pandas():
+    global pd
+    if pd is None:
+        import pandas
+        pd = pandas
+    return pd
+
 class ConfigurationManager:
     """Manage YAML configurations for anything
 
@@ -98,11 +154,31 @@ class ConfigurationManager:
         project_path (str): Root path for project
         project_name (str): Current project name
                             This name will be used for experiment name as default
+        backend (optional(str)): YAML parser backend, 'msgspec' or 'pyyaml'
+                                 defaults to msgspec when it is installed
     """
-    def __init__(self, project_name, project_path):
+    # how many batched history updates trigger an automatic flush
+    HISTORY_FLUSH_EVERY = 64
+
+    # how many queued experiment rows trigger an automatic persist
+    RECORD_FLUSH_EVERY = 64
+
+    # fixed schema of the experiment record
+    RECORD_COLUMNS = ('datetime', 'yaml', 'module', 'experiment_name', 'version', 'note')
+
+    def __init__(self, project_name, project_path, backend=None):
         # project name
         self.project_name = project_name
 
+        # YAML parser backend
+        if backend is None:
+            backend = 'msgspec' if MSGSPEC_AVAILABLE else 'pyyaml'
+        if backend == 'msgspec' and not MSGSPEC_AVAILABLE:
+            raise ImportError("Backend [ msgspec ] requested but msgspec is not installed")
+        if backend not in ('msgspec', 'pyyaml'):
+            raise ValueError(f"Backend should be [ msgspec ] or [ pyyaml ] but given [ {backend} ]")
+        self.backend = backend
+
         # Setting logger
         self.logger = InfoLogger("{0}".format(self.__class__.__qualname__))
         self.logger.info("Configuration manager initialized")
@@ -118,38 +194,49 @@ class ConfigurationManager:
         self._initialize_configuration_folder()
 
         # synchronize with modules already created
-        self.synchronize_module()
+        self._modules_dirty = True
+        self._module_files = {}
+        self._module_dirs = {}
+        self._ensure_modules()
 
         # load history for tracking recent YAML usage of project
-        self.history_path = os.path.join(self.config_path, "history.yaml")
+        ## JSON parses much faster than YAML and the history is a plain dict
+        self.history_path = os.path.join(self.config_path, "history.json")
+        self._history_stale = True
+        self._history_dirty = False
+        self._history_updates = 0
         self._load_history()
         self._synchronize_history()
 
-        # load experiment record for experiment manage of project
-        self.record_path = os.path.join(self.config_path, f"{self.project_name}_experiment_record.pkl")
-        self._load_record()
+        # make sure batched history and record updates reach the disk on exit
+        atexit.register(self._flush_history)
+        atexit.register(self._flush_record)
+
+        # experiment record for experiment manage of project
+        ## loaded lazily on the first experiment call so projects that
+        ## never touch experiments skip the pandas import entirely
+        record_ext = "parquet" if PYARROW_AVAILABLE else "pkl"
+        self.record_path = os.path.join(self.config_path, f"{self.project_name}_experiment_record.{record_ext}")
+        self._record_df = None
+        self._record_rows = []
+        self._record_dirty = False
 
     def __repr__(self):
         return f"ConfigurationManager(project_name=\'{self.project_name}, project_path=\'{PROJECT_PATH}\')"
 
     def __str__(self):
         # update the self.modules
-        self.synchronize_module()
+        self._ensure_modules()
 
         return f"Total Modules : {len(self.modules)}, Total YAML files : {self.__len__()}"
 
     def __len__(self):
         """return total YAML file number"""
         # update the self.modules
-        self.synchronize_module()
-
-        total_yaml = 0
-
-        for module in self.modules:
-            yaml_path_list = list(glob.glob(os.path.join(self.config_path, module) + '/*'))
-            total_yaml += len(yaml_path_list)
+        self._ensure_modules()
 
-        return total_yaml
+        return sum(1 for module in self.modules
+                     for _ in os.scandir(self._module_dir(module)))
 
 
 
@@ -158,15 +245,18 @@ class ConfigurationManager:
         ## project_path/configuration/data
         module_config_path = os.path.join(self.config_path, module)
 
-        # Check the folder exist and if not create
-        # config folder
-        if not os.path.isdir(module_config_path):
-            self.logger.info(f"[ {module} ] Configuration folder created")
+        # create the config folder - one syscall instead of isdir + mkdir
+        try:
             os.mkdir(module_config_path)
-        else:
+        except FileExistsError:
             raise FileExistsError(f"[ {module} ] Configuration folder already exist ")
 
-        self.synchronize_module()
+        self.logger.info(f"[ {module} ] Configuration folder created")
+
+        self._modules_dirty = True
+
+        # a fresh module holds nothing yet
+        self._module_files[module] = set()
 
     def delete_module(self, module):
         # project_path/configuration/data
@@ -179,18 +269,51 @@ class ConfigurationManager:
             shutil.rmtree(module_config_path)
             self.logger.info(f"[ {module} ] Configuration folder deleted")
 
+        # the module set changed so the caches and history need a refresh
+        self._modules_dirty = True
+        self._history_stale = True
+        self._module_files.pop(module, None)
+
         # delete the module from record
         self._delete_module_from_all_records(module)
 
     def synchronize_module(self):
-        config_list = os.listdir(self.config_path)
-
         modules = []
-        for f in config_list:
-            # only if the file is Directory
-            if os.path.isdir(os.path.join(self.config_path, f)):
-                modules.append(f)
+        module_dirs = {}
+        with os.scandir(self.config_path) as entries:
+            for entry in entries:
+                # only if the file is Directory
+                if entry.is_dir(follow_symlinks=False):
+                    modules.append(entry.name)
+                    module_dirs[entry.name] = entry.path
         self.modules = modules
+        self._module_dirs = module_dirs
+        self._modules_dirty = False
+
+    def _module_dir(self, module):
+        """return the module directory path without re-joining per call"""
+        path = self._module_dirs.get(module)
+        if path is None:
+            path = os.path.join(self.config_path, module)
+        return path
+
+    def _ensure_modules(self):
+        """re-scan the configuration folder only when it may have changed"""
+        if self._modules_dirty:
+            self.synchronize_module()
+
+    def _module_has_file(self, module, yaml_name):
+        """check a yaml exists using the cached module listing (no stat call)"""
+        files = self._module_files.get(module)
+
+        if files is None:
+            module_path = self._module_dir(module)
+            if not os.path.isdir(module_path):
+                return False
+            files = {entry.name for entry in os.scandir(module_path)}
+            self._module_files[module] = files
+
+        return yaml_name in files
 
 
 
@@ -211,12 +334,13 @@ class ConfigurationManager:
                            config_dict=config_dict,
                            override=override)
 
-    def get_yaml(self, yaml_name):
+    def get_yaml(self, yaml_name, keys=None):
         module, version, experiment_name = self._get_config_info(yaml_name)
 
         return self.get(module=module,
                         version=version,
-                        experiment_name=experiment_name)
+                        experiment_name=experiment_name,
+                        keys=keys)
 
     def delete_yaml(self, yaml_name):
         module, version, experiment_name = self._get_config_info(yaml_name)
@@ -234,7 +358,7 @@ class ConfigurationManager:
             experiment_name = self.project_name
 
         # update the existance of modules and history
-        self.synchronize_module()
+        self._ensure_modules()
         self._synchronize_history()
         if module not in self.modules:
             self.create_module(module)
@@ -246,9 +370,9 @@ class ConfigurationManager:
         yaml_name = self._get_yaml_name(module, experiment_name, version)
 
         # project_path/configuration/data/data_riiid_v1.0.yaml
-        yaml_path = os.path.join(self.config_path, module, yaml_name)
+        yaml_path = os.path.join(self._module_dir(module), yaml_name)
 
-        if os.path.isfile(yaml_path):
+        if self._module_has_file(module, yaml_name):
             raise FileExistsError(f"[ {yaml_name} ] file already exist ")
         else:
             # create new configuration
@@ -256,6 +380,11 @@ class ConfigurationManager:
             self.write_yaml(new_config_dict, yaml_path)
             self.logger.info(f"[ {yaml_name} ] file created successfully ")
 
+            # keep the cached listing in sync
+            files = self._module_files.get(module)
+            if files is not None:
+                files.add(yaml_name)
+
         # If user gave an configuration dictionary
         if config_dict:
             # update the information to the created configuration above
@@ -289,7 +418,7 @@ class ConfigurationManager:
             experiment_name = self.project_name
 
         # update the existance of modules and history
-        self.synchronize_module()
+        self._ensure_modules()
         self._synchronize_history()
         if module not in self.modules:
             raise FileNotFoundError(f"No Module [ {module} ] exist")
@@ -301,10 +430,10 @@ class ConfigurationManager:
         yaml_name = self._get_yaml_name(module, experiment_name, version)
 
         # project_path/configuration/data/data_riiid_v1.0.yaml
-        yaml_path = os.path.join(self.config_path, module, yaml_name)
+        yaml_path = os.path.join(self._module_dir(module), yaml_name)
 
         # If yaml doesn't exist raise an error
-        if not os.path.isfile(yaml_path):
+        if not self._module_has_file(module, yaml_name):
             raise FileNotFoundError(f"No file [ {yaml_name} ] to update")
         else:
             if override:
@@ -324,13 +453,21 @@ class ConfigurationManager:
 
         self.logger.info(f"[ {yaml_name} ] file updated successfully ")
 
-    def get(self, module, version, experiment_name=None):
+    def get(self, module, version, experiment_name=None, keys=None):
+        """Read a YAML configuration
+
+        Args:
+            keys (optional(set)): top level keys the caller needs
+                                  when given only the leading block of the
+                                  file holding them is parsed instead of
+                                  the whole file
+        """
         # If the experiment name is not given use the project name
         if experiment_name is None:
             experiment_name = self.project_name
 
         # update the existance of modules and history
-        self.synchronize_module()
+        self._ensure_modules()
         self._synchronize_history()
         if module not in self.modules:
             raise FileNotFoundError(f"No Module [ {module} ] exist")
@@ -338,25 +475,71 @@ class ConfigurationManager:
         yaml_name = self._get_yaml_name(module, experiment_name, version)
 
         # project_path/configuration/data/data_riiid_v1.0.yaml
-        yaml_path = os.path.join(self.config_path, module, yaml_name)
+        yaml_path = os.path.join(self._module_dir(module), yaml_name)
 
         # If yaml doesn't exist raise an error
-        if not os.path.isfile(yaml_path):
+        if not self._module_has_file(module, yaml_name):
             raise FileNotFoundError(f"No file [ {yaml_name} ] to get")
 
         # update the history
         self._update_history(yaml_path)
         self.logger.info(f"[ {yaml_name} ] file read successfully ")
 
+        # parse only the header block when specific keys are requested
+        if keys is not None:
+            header_dict = self._read_yaml_header(yaml_path, keys)
+            if header_dict is not None:
+                return header_dict
+
         return self.read_yaml(yaml_path)
 
+    def _read_yaml_header(self, yaml_path, keys):
+        """Parse only the leading block of a YAML file holding the given keys
+
+        Returns None when the requested keys aren't all found in the leading
+        block so the caller can fall back to a full parse
+        """
+        wanted = set(keys)
+        found = set()
+        header_lines = []
+
+        with open(yaml_path, 'r') as f:
+            for line in f:
+                # the header block ends at the first blank line
+                if not line.strip():
+                    break
+
+                # top level key line
+                if line[:1] not in (' ', '\t', '#'):
+                    # every requested key is captured - stop reading
+                    if wanted <= found:
+                        break
+                    found.add(line.split(':', 1)[0].strip())
+
+                header_lines.append(line)
+
+        if not wanted <= found:
+            return None
+
+        header_block = ''.join(header_lines)
+        if self.backend == 'msgspec':
+            config_dict = msgspec_yaml.decode(header_block)
+        else:
+            config_dict = yaml.load(header_block, Loader=SafeLoader)
+
+        # fall back when the parsed slice lost a requested key
+        if config_dict is None or not wanted <= set(config_dict):
+            return None
+
+        return config_dict
+
     def delete(self, module, version, experiment_name=None):
         # If the experiment name is not given use the project name
         if experiment_name is None:
             experiment_name = self.project_name
 
         # update the existance of modules and history
-        self.synchronize_module()
+        self._ensure_modules()
         self._synchronize_history()
         if module not in self.modules:
             raise FileNotFoundError(f"No Module [ {module} ] exist")
@@ -364,10 +547,10 @@ class ConfigurationManager:
         yaml_name = self._get_yaml_name(module, experiment_name, version)
 
         # project_path/configuration/data/data_riiid_v1.0.yaml
-        yaml_path = os.path.join(self.config_path, module, yaml_name)
+        yaml_path = os.path.join(self._module_dir(module), yaml_name)
 
         # If yaml doesn't exist raise an error
-        if not os.path.isfile(yaml_path):
+        if not self._module_has_file(module, yaml_name):
             raise FileNotFoundError(f"No file [ {yaml_name} ] to delete")
 
         # delete the experiment record
@@ -377,23 +560,29 @@ class ConfigurationManager:
         os.remove(yaml_path)
         self.logger.info(f"[ {yaml_name} ] file removed successfully ")
 
+        # keep the cached listing in sync
+        files = self._module_files.get(module)
+        if files is not None:
+            files.discard(yaml_name)
+
     def show(self, module):
         """Show the list of configuration files of module"""
-        self.synchronize_module()
+        self._ensure_modules()
+
+        if module not in self.modules:
+            raise FileNotFoundError(f"No Module [ {module} ] exist")
 
-        yaml_path_list = list(glob.glob(os.path.join(self.config_path, module) + '/*'))
-        yaml_list = [path.split('/')[-1] for path in yaml_path_list]
+        yaml_list = [entry.name for entry in os.scandir(self._module_dir(module))]
 
         return yaml_list
 
     def show_all(self):
         """Show all configuration files of modules"""
-        self.synchronize_module()
+        self._ensure_modules()
 
         all_yaml = {}
         for module in self.modules:
-            yaml_path_list = list(glob.glob(os.path.join(self.config_path, module) + '/*'))
-            yaml_list = [path.split('/')[-1] for path in yaml_path_list]
+            yaml_list = [entry.name for entry in os.scandir(self._module_dir(module))]
 
             all_yaml[module] = yaml_list
 
@@ -401,54 +590,158 @@ class ConfigurationManager:
 
 
 
+    @property
+    def record_df(self):
+        """experiment record DataFrame - loaded from disk on first access"""
+        if self._record_df is None:
+            self._load_record()
+        return self._record_df
+
+    @record_df.setter
+    def record_df(self, df):
+        self._record_df = df
+
     def _load_record(self):
+        pd = _import_pandas()
+
+        # migrate a legacy pickle record to parquet when pyarrow is available
+        legacy_path = os.path.join(self.config_path, f"{self.project_name}_experiment_record.pkl")
+        if PYARROW_AVAILABLE and not os.path.isfile(self.record_path) and os.path.isfile(legacy_path):
+            self.logger.info("[ record ] Migrating pickle record to parquet")
+            self.write_record_file(self.read_pickle(legacy_path), self.record_path)
+            os.remove(legacy_path)
+
         # check the existance of record file
         if os.path.isfile(self.record_path):
-            self.record_df = self.read_pickle(self.record_path)
+            self.record_df = self.read_record_file(self.record_path)
             self.logger.info(f"[ record ] Loaded successfully")
         else:
             # if the record was never created
             self.logger.info("[ record ] Initializing file")
-            self.record_df = pd.DataFrame(columns=['datetime', 'yaml', 'module', 'experiment_name', 'version', 'note'])
-            self.write_pickle(self.record_df, self.record_path)
+            self.record_df = pd.DataFrame(columns=list(self.RECORD_COLUMNS))
+            self.write_record_file(self.record_df, self.record_path)
+
+        self._record_mtime = os.stat(self.record_path).st_mtime_ns
+
+    def _flush_record_rows(self):
+        """merge the pending experiment rows into record_df in one concat"""
+        if self._record_rows:
+            pd = _import_pandas()
+            # one dtype inference per batch instead of one per row
+            rows_df = pd.DataFrame.from_records(self._record_rows,
+                                                columns=list(self.RECORD_COLUMNS))
+            self.record_df = pd.concat([self.record_df, rows_df], ignore_index=True)
+            self._record_rows.clear()
+
+    def _flush_record(self):
+        if self._record_dirty:
+            try:
+                self._write_record()
+            except Exception:
+                # the configuration folder may be gone by the time the
+                # atexit hook runs, and interpreter shutdown can break
+                # pandas in ways beyond OSError - never raise from here
+                pass
+
+    def _write_record(self):
+        self._flush_record_rows()
+        self.write_record_file(self.record_df, self.record_path)
+        self._record_mtime = os.stat(self.record_path).st_mtime_ns
+        self._record_dirty = False
+
+    def _refresh_record(self):
+        """re-read the record only when it changed on disk"""
+        # nothing cached yet - the lazy load will read the latest state
+        if self._record_df is None:
+            return
+
+        record_mtime = os.stat(self.record_path).st_mtime_ns
+
+        if record_mtime != self._record_mtime:
+            self.record_df = self.read_record_file(self.record_path)
+            self._record_mtime = record_mtime
 
     def _delete_experiment_from_all_records(self, yaml_path):
         """When user delete the configuration file delete all the related experiment record"""
         # project_path/configuration/data/data_riiid_v1.0.yaml
-        yaml_info = yaml_path.split('/')
-
         ## data_riiid_v1.0.yaml
-        yaml_name = yaml_info[-1]
+        yaml_name = os.path.basename(yaml_path)
+
+        # unsaved rows must reach the disk before the file sweep below
+        # or the pruned on-disk copy would win over the newer ones
+        if self._record_dirty:
+            self._write_record()
 
         # delete experiment record from all the projects experiment records
-        for record_path in glob.glob(self.config_path + '/*_experiment_record.pkl'):
+        for entry in os.scandir(self.config_path):
+            if not entry.name.endswith(RECORD_SUFFIXES):
+                continue
+            record_path = entry.path
+
+            # with parquet, peek at the yaml column first and skip
+            # records that never used this yaml (columnar projection)
+            if record_path.endswith('.parquet'):
+                yaml_col = self.read_record_file(record_path, columns=['yaml'])['yaml']
+                if not (yaml_col == yaml_name).any():
+                    continue
+
             # read the following experiment record file
-            record_df = self.read_pickle(record_path)
+            record_df = self.read_record_file(record_path)
 
             # Drop all the rows related to the yaml
-            record_df = record_df.query("yaml != @yaml_name").reset_index(drop=True)
+            # plain boolean mask - query() would invoke the expression parser
+            mask = record_df['yaml'].values != yaml_name
+            record_df = record_df.iloc[mask].reset_index(drop=True)
+
+            # save the pruned record
+            self.write_record_file(record_df, record_path)
 
-            # save to pickle
-            self.write_pickle(record_df, record_path)
+            # keep the cached copy of the current project in sync
+            if record_path == self.record_path:
+                self.record_df = record_df
+                self._record_mtime = os.stat(record_path).st_mtime_ns
 
-        # update the current record_df
-        self.record_df = self.read_pickle(self.record_path)
+        # update the current record_df if someone else rewrote it
+        self._refresh_record()
 
     def _delete_module_from_all_records(self, module):
         """When user delete the configuration file delete all the related experiment record"""
+        # unsaved rows must reach the disk before the file sweep below
+        # or the pruned on-disk copy would win over the newer ones
+        if self._record_dirty:
+            self._write_record()
+
         # delete module record from all the projects experiment records
-        for record_path in glob.glob(self.config_path + '/*_experiment_record.pkl'):
+        for entry in os.scandir(self.config_path):
+            if not entry.name.endswith(RECORD_SUFFIXES):
+                continue
+            record_path = entry.path
+
+            # with parquet, peek at the module column first and skip
+            # records that never used this module (columnar projection)
+            if record_path.endswith('.parquet'):
+                module_col = self.read_record_file(record_path, columns=['module'])['module']
+                if not (module_col == module).any():
+                    continue
+
             # read the following experiment record file
-            record_df = self.read_pickle(record_path)
+            record_df = self.read_record_file(record_path)
 
             # Drop all the rows related to the yaml
-            record_df = record_df.query("module != @module").reset_index(drop=True)
+            # plain boolean mask - query() would invoke the expression parser
+            mask = record_df['module'].values != module
+            record_df = record_df.iloc[mask].reset_index(drop=True)
 
-            # save to pickle
-            self.write_pickle(record_df, record_path)
+            # save the pruned record
+            self.write_record_file(record_df, record_path)
 
-        # update the current record_df
-        self.record_df = self.read_pickle(self.record_path)
+            # keep the cached copy of the current project in sync
+            if record_path == self.record_path:
+                self.record_df = record_df
+                self._record_mtime = os.stat(record_path).st_mtime_ns
+
+        # update the current record_df if someone else rewrote it
+        self._refresh_record()
 
     def save_experiment(self, module, version, experiment_name=None, note=""):
         """Save the experiment to pandas DataFrame
@@ -467,27 +760,36 @@ class ConfigurationManager:
         yaml_name = self._get_yaml_name(module, experiment_name, version)
 
         # project_path/configuration/data/data_riiid_v1.0.yaml
-        yaml_path = os.path.join(self.config_path, module, yaml_name)
+        yaml_path = os.path.join(self._module_dir(module), yaml_name)
 
         # If yaml doesn't exist raise an error
-        if not os.path.isfile(yaml_path):
+        if not self._module_has_file(module, yaml_name):
             raise FileNotFoundError(f"No experiment [ {yaml_name} ] to save")
 
-        # save experiment
-        self.record_df = self.record_df.append({'datetime': datetime.today().strftime("%Y-%m-%d %H:%M:%S"),
-                                                'yaml': yaml_name,
-                                                'module': module,
-                                                'experiment_name': experiment_name,
-                                                'version': version,
-                                                'note': note},
-                                               ignore_index=True)
+        # importing pandas is no longer allowed once the interpreter is
+        # shutting down, so pull it in now rather than in the atexit flush
+        _import_pandas()
 
+        # save experiment
+        # queue a fixed-schema row; rows are merged and persisted in
+        # batches so each save amortizes to a plain list append
+        self._record_rows.append((datetime.today().strftime("%Y-%m-%d %H:%M:%S"),
+                                  yaml_name,
+                                  module,
+                                  experiment_name,
+                                  version,
+                                  note))
+        self._record_dirty = True
+
+        # persist once enough rows accumulated (flush() forces it earlier)
+        if len(self._record_rows) >= self.RECORD_FLUSH_EVERY:
+            self._write_record()
 
-        # save to pickle
-        self.write_pickle(self.record_df, self.record_path)
         self.logger.info(f"[ {yaml_name} ] successfully saved")
 
     def show_experiment(self):
+        self._flush_record_rows()
+
         return self.record_df
 
     def load_experiment(self, index):
@@ -495,6 +797,8 @@ class ConfigurationManager:
 
         check the experiments at record_df
         """
+        self._flush_record_rows()
+
         # 01_data
         module = self.record_df.iloc[index].module
 
@@ -502,10 +806,10 @@ class ConfigurationManager:
         yaml_name = self.record_df.iloc[index].yaml
 
         # project_path/configuration/data/data_riiid_v1.0.yaml
-        yaml_path = os.path.join(self.config_path, module, yaml_name)
+        yaml_path = os.path.join(self._module_dir(module), yaml_name)
 
         # If yaml doesn't exist raise an error
-        if not os.path.isfile(yaml_path):
+        if not self._module_has_file(module, yaml_name):
             raise FileNotFoundError(f"No file [ {yaml_name} ] to load")
 
         # update the history
@@ -520,6 +824,8 @@ class ConfigurationManager:
 
         check the experiments at record_df
         """
+        self._flush_record_rows()
+
         # data_riiid_v1.0.yaml
         yaml_name = self.record_df.iloc[index].yaml
 
@@ -527,7 +833,7 @@ class ConfigurationManager:
         self.record_df = self.record_df.drop(index).reset_index(drop=True)
 
         # save to pickle
-        self.write_pickle(self.record_df, self.record_path)
+        self._write_record()
         self.logger.info(f"[ {yaml_name} ] successfully deleted")
 
 
@@ -536,60 +842,110 @@ class ConfigurationManager:
         # update history
         self._synchronize_history()
 
-        return self.read_yaml(self.history_path)
+        # history is already held in memory
+        return self.history
 
     def _load_history(self):
+        # migrate a legacy YAML history to JSON
+        legacy_path = os.path.join(self.config_path, "history.yaml")
+        if not os.path.isfile(self.history_path) and os.path.isfile(legacy_path):
+            self.logger.info("[ history ] Migrating YAML history to JSON")
+            self.history = self.read_yaml(legacy_path)
+            self._write_history()
+            os.remove(legacy_path)
+
         # check the existance of history file
         if os.path.isfile(self.history_path):
-            self.history = self.read_yaml(self.history_path)
+            self.history = self.read_json(self.history_path)
+            self._history_mtime = os.stat(self.history_path).st_mtime_ns
 
             # If the project name wasn't used before add to history
             if not self.project_name in self.history:
                 self.logger.info(f"[ history ] Add new project {self.project_name}")
                 self.history[self.project_name] = {}
-                self.write_yaml(self.history, self.history_path)
+                self._write_history()
             else:
                 self.logger.info(f"[ history ] Loaded successfully")
         else:
             # if the history was never created
             self.logger.info("[ history ] Initializing file")
             self.history = {self.project_name: {}}
-            self.write_yaml(self.history, self.history_path)
+            self._write_history()
+
+    def _write_history(self):
+        self.write_json(self.history, self.history_path)
+        self._history_mtime = os.stat(self.history_path).st_mtime_ns
+        self._history_dirty = False
+        self._history_updates = 0
+
+    def flush(self):
+        """write any batched history or experiment update to disk"""
+        self._flush_history()
+        self._flush_record()
+
+    def _flush_history(self):
+        if self._history_dirty:
+            try:
+                self._write_history()
+            except OSError:
+                # the configuration folder may be gone by the time the
+                # atexit hook runs - nothing left to flush to
+                pass
 
     def _update_history(self, yaml_path):
         # project_path/configuration/data/data_riiid_v1.0.yaml
-        yaml_info = yaml_path.split('/')
+        ## project_path/configuration/data | data_riiid_v1.0.yaml
+        head, yaml_name = os.path.split(yaml_path)
 
         ## data
-        module = yaml_info[-2]
+        module = os.path.basename(head)
 
-        ## data_riiid_v1.0.yaml
-        yaml_name = yaml_info[-1]
+        # skip the update when the history already points to this yaml
+        if self.history[self.project_name].get(module) == yaml_name:
+            return
 
-        # update and write the history
+        # update the history and batch the write
         self.history[self.project_name][module] = yaml_name
-        self.write_yaml(self.history, self.history_path)
+        self._history_dirty = True
+        self._history_updates += 1
+
+        # opportunistic flush so a long session can't lose much history
+        if self._history_updates >= self.HISTORY_FLUSH_EVERY:
+            self._flush_history()
 
     def _delete_history(self, module):
         del self.history[self.project_name][module]
-        self.write_yaml(self.history, self.history_path)
+        self._write_history()
 
     def _synchronize_history(self):
         """synchronize the history with current existing modules"""
+        # nothing to prune unless the module set changed
+        if not self._history_stale:
+            return
+
+        # the prune must run against the current module list or a dead
+        # module would survive and the stale flag be cleared for good
+        self._ensure_modules()
+
+        changed = False
+
         for history_module in list(self.history[self.project_name].keys()):
             # If the module listed at history doesn't exist delete
             if history_module not in self.modules:
-                self._delete_history(history_module)
+                del self.history[self.project_name][history_module]
+                changed = True
+
+        # only touch the disk when the pruning actually removed something
+        if changed:
+            self._write_history()
 
-        self.write_yaml(self.history, self.history_path)
+        self._history_stale = False
 
 
 
     def _initialize_configuration_folder(self):
         # configuration folder
-        if not os.path.isdir(self.config_path):
-            self.logger.info("[ Configuration ] folder created")
-            os.mkdir(self.config_path)
+        os.makedirs(self.config_path, exist_ok=True)
 
     def _initialize_config_dict(self, version):
         """Basic template for configuration dictionary"""
@@ -604,15 +960,28 @@ class ConfigurationManager:
 
         return config_dict
 
-    def _get_yaml_name(self, module, experiment_name, version):
+    @staticmethod
+    def _get_yaml_name(module, experiment_name, version):
         """Return yaml file name using module, name, version information"""
+        # no lru_cache here: 1 and 1.0 hash identically so cached entries
+        # would leak between int and float versions, and a single f-string
+        # is cheaper than the cache lookup anyway
         return f"{module}_{experiment_name}_v{version}.yaml"
 
-    def _get_config_info(self, yaml_name):
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _get_config_info(yaml_name):
         """Return module, name, version information using yaml name"""
         # data_riiid_v1.0.yaml
+        # one C-implemented regex match covers the common shape
+        match = YAML_NAME_RE.match(yaml_name)
+        if match:
+            return match['module'], float(match['version']), match['experiment']
+
+        # fall back to the step-by-step checks for unusual version
+        # spellings and a precise error message on invalid names
         # check valid extension
-        if yaml_name[-5:] != '.yaml':
+        if not yaml_name.endswith('.yaml'):
             raise ValueError(f'Extension should be [ .yaml ] but given [ {yaml_name[-5:]} ]')
 
         # data_riiid_v1.0
@@ -652,16 +1021,64 @@ class ConfigurationManager:
 
 
     def read_pickle(self, pickle_path):
+        pd = _import_pandas()
         return pd.read_pickle(pickle_path)
 
     def write_pickle(self, df, pickle_path):
-        df.to_pickle(pickle_path)
+        # write to a sibling tmp file and rename so a crash mid-write
+        # can never leave a half-written record behind
+        tmp_path = pickle_path + '.tmp'
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, pickle_path)
+
+    def read_record_file(self, record_path, columns=None):
+        if record_path.endswith('.parquet'):
+            pd = _import_pandas()
+            return pd.read_parquet(record_path, engine='pyarrow', columns=columns)
+        return self.read_pickle(record_path)
+
+    def write_record_file(self, df, record_path):
+        if record_path.endswith('.parquet'):
+            tmp_path = record_path + '.tmp'
+            df.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+            os.replace(tmp_path, record_path)
+        else:
+            self.write_pickle(df, record_path)
+
+    def read_json(self, json_path):
+        with open(json_path, 'r') as f:
+            return json.load(f)
+
+    def write_json(self, obj, json_path):
+        tmp_path = json_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(obj, f, separators=(',', ':'))
+        os.replace(tmp_path, json_path)
 
     def read_yaml(self, yaml_path):
-        with open(yaml_path, 'r') as f:
-            config_dict = yaml.load(f, Loader=yaml.FullLoader)
-        return config_dict
+        try:
+            stat = os.stat(yaml_path)
+        except OSError:
+            # keep the original error behaviour for missing files
+            with open(yaml_path, 'r') as f:
+                return yaml.load(f, Loader=SafeLoader)
+
+        config_dict = _parse_yaml_cached(yaml_path, stat.st_mtime_ns, stat.st_size,
+                                         backend=self.backend)
+
+        # callers may mutate the result so hand out a copy
+        return copy.deepcopy(config_dict)
 
     def write_yaml(self, config_dict, yaml_path):
-        with open(yaml_path, 'w') as f:
-            yaml.dump(config_dict, f, default_flow_style=False)
+        # write to a sibling tmp file and rename so a crash mid-write
+        # can never leave a half-written configuration behind
+        tmp_path = yaml_path + '.tmp'
+
+        if self.backend == 'msgspec':
+            with open(tmp_path, 'wb') as f:
+                f.write(msgspec_yaml.encode(config_dict))
+        else:
+            with open(tmp_path, 'w') as f:
+                yaml.dump(config_dict, f, Dumper=SafeDumper, default_flow_style=False)
+
+        os.replace(tmp_path, yaml_path)